@@ -9,11 +9,28 @@ Includes web shell for remote terminal access
 from flask import Flask, request, jsonify, render_template
 from flask_socketio import SocketIO, emit, join_room, leave_room
 from functools import wraps
+import atexit
 import json
 import os
+import threading
+import time
+from contextvars import ContextVar
 from datetime import datetime, timedelta
 from pathlib import Path
 
+# orjson is a C-implemented JSON encoder that is several times faster than
+# stdlib json and returns bytes directly; fall back to stdlib if missing
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+
 # Import auth and commands modules
 import auth
 import commands
@@ -30,32 +47,156 @@ socketio = SocketIO(app, cors_allowed_origins="*", async_mode='gevent')
 DATA_DIR = Path(os.environ.get('DATA_DIR', '/app/data'))
 DATA_DIR.mkdir(parents=True, exist_ok=True)
 LOG_FILE = DATA_DIR / 'benchmark_data.jsonl'
-CLIENTS_FILE = DATA_DIR / 'clients.json'
+CLIENTS_FILE = DATA_DIR / 'clients.jsonl'
 
-# In-memory client registry (last heartbeat times)
-clients_registry = {}
+# Compact the append-only registry log once it grows past this size
+CLIENTS_COMPACT_BYTES = 8 * 1024 * 1024
 
-def load_clients_registry():
-    """Load clients registry from file"""
-    global clients_registry
-    if CLIENTS_FILE.exists():
-        try:
-            with open(CLIENTS_FILE, 'r') as f:
-                clients_registry = json.load(f)
-        except Exception as e:
-            print(f"Error loading clients registry: {e}")
-            clients_registry = {}
-    else:
-        clients_registry = {}
+# In-memory client registry (last heartbeat times), held in a ContextVar
+# so parallel test workers can swap in an isolated dict; in the server
+# process every context sees the shared default
+clients_registry = ContextVar('clients_registry', default={})
+
+def get_registry():
+    """Return the active clients registry mapping"""
+    return clients_registry.get()
 
-def save_clients_registry():
-    """Save clients registry to file"""
+def load_clients_registry():
+    """Rebuild the clients registry by replaying the append-only log"""
+    registry = get_registry()
+    registry.clear()
+    if not CLIENTS_FILE.exists():
+        return
     try:
-        with open(CLIENTS_FILE, 'w') as f:
-            json.dump(clients_registry, f, indent=2)
+        with open(CLIENTS_FILE, 'r') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # Skip torn or corrupt lines, keep the rest of the log
+                    continue
+                client_id = record.get('id')
+                if client_id:
+                    registry[client_id] = record.get('state', {})
+    except Exception as e:
+        print(f"Error loading clients registry: {e}")
+        registry.clear()
+
+# Dirty client ids waiting for the background flusher (group commit):
+# a burst of heartbeats coalesces into one append instead of one write
+# per save
+_dirty_clients = set()
+_dirty_lock = threading.Lock()
+_flush_lock = threading.Lock()
+FLUSH_INTERVAL_SECONDS = 0.1
+
+# WAL-style durability: appends go to a persistent handle without fsync,
+# and the flusher syncs to disk on this cadence (plus once at shutdown)
+SYNC_INTERVAL_SECONDS = 0.25
+_wal_f = None
+_wal_path = None
+
+def _wal_handle():
+    """Return the persistent registry log handle, reopening on path change"""
+    global _wal_f, _wal_path
+    if _wal_f is None or _wal_f.closed or _wal_path != CLIENTS_FILE:
+        if _wal_f is not None and not _wal_f.closed:
+            _wal_f.close()
+        _wal_f = open(CLIENTS_FILE, 'ab', buffering=1 << 20)
+        _wal_path = CLIENTS_FILE
+    return _wal_f
+
+# Serialized log lines keyed by client id, invalidated when a client is
+# marked dirty, so unchanged entries are not re-encoded on later saves
+# or at compaction
+_serialized_cache = {}
+
+def save_clients_registry(client_id=None):
+    """
+    Mark registry entries dirty for the background flusher
+    All clients are marked when client_id is None; call flush_now() to
+    force the pending updates to disk immediately
+    """
+    with _dirty_lock:
+        if client_id is not None:
+            _dirty_clients.add(client_id)
+            _serialized_cache.pop(client_id, None)
+        else:
+            _dirty_clients.update(get_registry())
+            _serialized_cache.clear()
+
+def _serialize_client(client_id):
+    """Return the cached log line for a client, encoding it if needed"""
+    line = _serialized_cache.get(client_id)
+    if line is None:
+        line = _dumps({'id': client_id, 'state': get_registry()[client_id]}) + b'\n'
+        _serialized_cache[client_id] = line
+    return line
+
+def flush_now():
+    """Append all dirty registry entries to the log in a single write"""
+    with _dirty_lock:
+        client_ids = [cid for cid in _dirty_clients if cid in get_registry()]
+        _dirty_clients.clear()
+    if not client_ids:
+        return
+    try:
+        with _flush_lock:
+            buf = bytearray()
+            for cid in client_ids:
+                buf += _serialize_client(cid)
+            f = _wal_handle()
+            f.write(bytes(buf))
+            f.flush()
+            _compact_if_needed()
     except Exception as e:
         print(f"Error saving clients registry: {e}")
 
+def sync_now():
+    """Flush pending registry updates and fsync the log to disk"""
+    flush_now()
+    with _flush_lock:
+        if _wal_f is not None and not _wal_f.closed:
+            try:
+                os.fsync(_wal_f.fileno())
+            except OSError as e:
+                print(f"Error syncing clients registry: {e}")
+
+def _registry_flusher():
+    """Background loop that flushes dirty registry entries periodically"""
+    last_sync = time.monotonic()
+    while True:
+        time.sleep(FLUSH_INTERVAL_SECONDS)
+        flush_now()
+        if time.monotonic() - last_sync >= SYNC_INTERVAL_SECONDS:
+            sync_now()
+            last_sync = time.monotonic()
+
+threading.Thread(target=_registry_flusher, daemon=True).start()
+atexit.register(sync_now)
+
+def _compact_if_needed():
+    """Atomically rewrite the log once stale updates outgrow the threshold"""
+    global _wal_f
+    try:
+        if CLIENTS_FILE.stat().st_size <= CLIENTS_COMPACT_BYTES:
+            return
+        tmp_file = CLIENTS_FILE.with_suffix('.tmp')
+        with open(tmp_file, 'wb') as f:
+            for cid in list(get_registry()):
+                f.write(_serialize_client(cid))
+        os.replace(tmp_file, CLIENTS_FILE)
+        # The persistent handle now points at the replaced file; drop it
+        # so the next append reopens the compacted log
+        if _wal_f is not None and not _wal_f.closed:
+            _wal_f.close()
+        _wal_f = None
+    except OSError as e:
+        print(f"Error compacting clients registry: {e}")
+
 @app.route('/')
 def index():
     """Serve the visualization dashboard"""
@@ -177,6 +318,22 @@ def health():
     """Health check endpoint"""
     return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
 
+def _record_heartbeat(client_id, data):
+    """Update the registry from a heartbeat payload and log the change"""
+    # last_heartbeat is stored as epoch seconds; comparing floats is
+    # far cheaper than round-tripping ISO strings on every request,
+    # and it is converted back to ISO at the API boundary
+    get_registry()[client_id] = {
+        'client_id': client_id,
+        'hostname': data.get('hostname', 'unknown'),
+        'last_heartbeat': time.time(),
+        'router1_interface': data.get('router1_interface'),
+        'router2_interface': data.get('router2_interface'),
+    }
+
+    # Append just this client's update to the registry log
+    save_clients_registry(client_id)
+
 @app.route('/api/heartbeat', methods=['POST'])
 def heartbeat():
     """
@@ -191,17 +348,7 @@ def heartbeat():
 
         client_id = data['client_id']
 
-        # Update client registry
-        clients_registry[client_id] = {
-            'client_id': client_id,
-            'hostname': data.get('hostname', 'unknown'),
-            'last_heartbeat': datetime.now().isoformat(),
-            'router1_interface': data.get('router1_interface'),
-            'router2_interface': data.get('router2_interface'),
-        }
-
-        # Save to disk periodically (every heartbeat to keep it simple)
-        save_clients_registry()
+        _record_heartbeat(client_id, data)
 
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Heartbeat from client: {client_id}")
 
@@ -220,17 +367,20 @@ def get_clients():
     """
     try:
         timeout_seconds = int(request.args.get('timeout', 120))
-        now = datetime.now()
+        now_ts = time.time()
 
         clients_list = []
-        for client_id, client_info in clients_registry.items():
-            last_heartbeat = datetime.fromisoformat(client_info['last_heartbeat'])
-            time_since_heartbeat = (now - last_heartbeat).total_seconds()
+        for client_id, client_info in get_registry().items():
+            last_heartbeat = client_info['last_heartbeat']
+            if isinstance(last_heartbeat, str):
+                # Registry entries written before the epoch-float change
+                last_heartbeat = datetime.fromisoformat(last_heartbeat).timestamp()
+            time_since_heartbeat = now_ts - last_heartbeat
 
             client_data = {
                 'client_id': client_id,
                 'hostname': client_info.get('hostname', 'unknown'),
-                'last_heartbeat': client_info['last_heartbeat'],
+                'last_heartbeat': datetime.fromtimestamp(last_heartbeat).isoformat(),
                 'seconds_since_heartbeat': int(time_since_heartbeat),
                 'status': 'online' if time_since_heartbeat < timeout_seconds else 'offline',
                 'router1_interface': client_info.get('router1_interface'),
@@ -531,15 +681,23 @@ def clear_pending_commands(client_id):
 # Command Polling Endpoints (Client -> Server)
 # ============================================================================
 
-@app.route('/api/commands/poll', methods=['GET'])
+@app.route('/api/commands/poll', methods=['GET', 'POST'])
 @require_client_auth
 def poll_commands():
     """
     Client polls for pending commands
+    A POST may carry the client's heartbeat payload in the body, which is
+    recorded here so polling clients need no separate heartbeat request
     Returns the next pending command (signed) or empty if none
     """
     try:
         client_id = request.headers.get('X-Client-ID')
+
+        if request.method == 'POST':
+            data = request.get_json(silent=True)
+            if data and data.get('client_id'):
+                _record_heartbeat(data['client_id'], data)
+
         command = commands.pop_pending_command(client_id)
 
         if command:
@@ -1256,7 +1414,7 @@ if __name__ == '__main__':
 
     # Load existing clients registry
     load_clients_registry()
-    print(f"Loaded {len(clients_registry)} client(s) from registry")
+    print(f"Loaded {len(get_registry())} client(s) from registry")
 
     # Run with Socket.IO (gevent)
     socketio.run(app, host='0.0.0.0', port=5000, debug=False)
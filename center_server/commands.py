@@ -25,6 +25,13 @@ COMMAND_AUDIT_LOG = DATA_DIR / 'command_audit.jsonl'
 MAX_OUTPUT_SIZE = 65536  # 64KB max output
 COMMAND_TIMEOUT_SECONDS = 60  # Default timeout
 
+# Compiled once at import: the validators run on every parameter of
+# every queued command, and inline re.match pays a cache-key lookup per
+# call
+_IP_RE = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+_HOSTNAME_RE = re.compile(r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?$')
+_PATH_RE = re.compile(r'^[a-zA-Z0-9_\-\.\/]+$')
+
 
 # ============================================================================
 # Command Whitelist Management
@@ -107,8 +114,7 @@ def validate_param_value(value: str, validator: dict) -> bool:
 
     if validator_type == 'ip':
         # Validate IPv4 address
-        pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-        if not re.match(pattern, value):
+        if not _IP_RE.match(value):
             return False
         # Check each octet is valid
         octets = value.split('.')
@@ -119,8 +125,7 @@ def validate_param_value(value: str, validator: dict) -> bool:
 
     elif validator_type == 'hostname':
         # Validate hostname (alphanumeric, hyphens, dots)
-        pattern = r'^[a-zA-Z0-9]([a-zA-Z0-9\-\.]*[a-zA-Z0-9])?$'
-        return bool(re.match(pattern, value)) and len(value) <= 255
+        return bool(_HOSTNAME_RE.match(value)) and len(value) <= 255
 
     elif validator_type == 'integer':
         try:
@@ -139,8 +144,7 @@ def validate_param_value(value: str, validator: dict) -> bool:
         # Only allow safe paths (no .., no absolute paths starting with /)
         if '..' in value or value.startswith('/'):
             return False
-        pattern = r'^[a-zA-Z0-9_\-\.\/]+$'
-        return bool(re.match(pattern, value))
+        return bool(_PATH_RE.match(value))
 
     return True  # Default: accept if no validator type specified
 
@@ -26,10 +26,10 @@ def client(tmp_path, monkeypatch):
     # Verify paths were set correctly
     monkeypatch.setattr(app_module, 'DATA_DIR', tmp_path)
     monkeypatch.setattr(app_module, 'LOG_FILE', tmp_path / 'benchmark_data.jsonl')
-    monkeypatch.setattr(app_module, 'CLIENTS_FILE', tmp_path / 'clients.json')
+    monkeypatch.setattr(app_module, 'CLIENTS_FILE', tmp_path / 'clients.jsonl')
 
     # Clear registry
-    app_module.clients_registry.clear()
+    app_module.get_registry().clear()
 
     app_module.app.config['TESTING'] = True
 
@@ -37,7 +37,7 @@ def client(tmp_path, monkeypatch):
         yield test_client
 
     # Cleanup
-    app_module.clients_registry.clear()
+    app_module.get_registry().clear()
 
 
 class TestHealthEndpoint:
@@ -139,8 +139,8 @@ class TestHeartbeat:
                    data=json.dumps(heartbeat_data),
                    content_type='application/json')
 
-        assert 'test-client-1' in app_module.clients_registry
-        assert app_module.clients_registry['test-client-1']['hostname'] == 'host-1'
+        assert 'test-client-1' in app_module.get_registry()
+        assert app_module.get_registry()['test-client-1']['hostname'] == 'host-1'
 
     def test_heartbeat_missing_client_id(self, client):
         """Test handling of heartbeat without client_id"""
@@ -168,7 +168,7 @@ class TestHeartbeat:
         client.post('/api/heartbeat',
                    data=json.dumps(heartbeat_data),
                    content_type='application/json')
-        first_timestamp = app_module.clients_registry['update-test-client']['last_heartbeat']
+        first_timestamp = app_module.get_registry()['update-test-client']['last_heartbeat']
 
         # Wait a moment and send second heartbeat
         time.sleep(0.1)
@@ -176,7 +176,7 @@ class TestHeartbeat:
         client.post('/api/heartbeat',
                    data=json.dumps(heartbeat_data),
                    content_type='application/json')
-        second_timestamp = app_module.clients_registry['update-test-client']['last_heartbeat']
+        second_timestamp = app_module.get_registry()['update-test-client']['last_heartbeat']
 
         assert second_timestamp > first_timestamp
 
@@ -197,12 +197,12 @@ class TestGetClients:
         import app as app_module
 
         # Add test clients
-        app_module.clients_registry['client-1'] = {
+        app_module.get_registry()['client-1'] = {
             'client_id': 'client-1',
             'hostname': 'host-1',
             'last_heartbeat': datetime.now().isoformat()
         }
-        app_module.clients_registry['client-2'] = {
+        app_module.get_registry()['client-2'] = {
             'client_id': 'client-2',
             'hostname': 'host-2',
             'last_heartbeat': datetime.now().isoformat()
@@ -219,7 +219,7 @@ class TestGetClients:
         import app as app_module
 
         # Add online client (recent heartbeat)
-        app_module.clients_registry['online-client'] = {
+        app_module.get_registry()['online-client'] = {
             'client_id': 'online-client',
             'hostname': 'online-host',
             'last_heartbeat': datetime.now().isoformat()
@@ -237,7 +237,7 @@ class TestGetClients:
 
         # Add offline client (old heartbeat > 2 minutes)
         old_time = datetime.now() - timedelta(seconds=150)
-        app_module.clients_registry['offline-client'] = {
+        app_module.get_registry()['offline-client'] = {
             'client_id': 'offline-client',
             'hostname': 'offline-host',
             'last_heartbeat': old_time.isoformat()
@@ -255,7 +255,7 @@ class TestGetClients:
 
         # Add client with 60-second-old heartbeat
         old_time = datetime.now() - timedelta(seconds=60)
-        app_module.clients_registry['test-client'] = {
+        app_module.get_registry()['test-client'] = {
             'client_id': 'test-client',
             'hostname': 'test-host',
             'last_heartbeat': old_time.isoformat()
@@ -276,12 +276,12 @@ class TestGetClients:
         import app as app_module
 
         # Add clients with different timestamps
-        app_module.clients_registry['old-client'] = {
+        app_module.get_registry()['old-client'] = {
             'client_id': 'old-client',
             'hostname': 'old-host',
             'last_heartbeat': (datetime.now() - timedelta(seconds=100)).isoformat()
         }
-        app_module.clients_registry['new-client'] = {
+        app_module.get_registry()['new-client'] = {
             'client_id': 'new-client',
             'hostname': 'new-host',
             'last_heartbeat': datetime.now().isoformat()
@@ -6,14 +6,15 @@ import pytest
 import json
 import sys
 import os
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from app import (
     load_clients_registry,
     save_clients_registry,
-    clients_registry,
+    flush_now,
+    get_registry,
     CLIENTS_FILE
 )
 
@@ -24,66 +25,85 @@ class TestClientRegistryPersistence:
     @pytest.fixture(autouse=True)
     def setup_teardown(self):
         """Clear registry before each test"""
-        clients_registry.clear()
+        get_registry().clear()
         yield
-        clients_registry.clear()
+        get_registry().clear()
 
     def test_save_clients_registry(self, tmp_path, monkeypatch):
-        """Test saving registry to file"""
+        """Test saving registry updates to the append-only log"""
         # Set up test file path
-        test_file = tmp_path / 'clients.json'
+        test_file = tmp_path / 'clients.jsonl'
         monkeypatch.setattr('app.CLIENTS_FILE', test_file)
 
         # Add test data to registry
-        clients_registry['client-1'] = {
+        get_registry()['client-1'] = {
             'client_id': 'client-1',
             'hostname': 'host-1',
             'last_heartbeat': datetime.now().isoformat()
         }
 
-        # Save registry
-        save_clients_registry()
+        # Save registry and force the coalesced write to disk
+        save_clients_registry('client-1')
+        flush_now()
 
-        # Verify file exists and contains data
+        # Verify file exists and contains the update record
         assert test_file.exists()
         with open(test_file, 'r') as f:
-            saved_data = json.load(f)
-            assert 'client-1' in saved_data
-            assert saved_data['client-1']['hostname'] == 'host-1'
-
-    def test_load_clients_registry(self, tmp_path):
-        """Test loading registry from file logic"""
-        # This is a simplified test - just verify the function doesn't crash
-        # More detailed testing would require complex mocking
-        test_file = tmp_path / 'clients.json'
-
-        # Create test data file
-        test_data = {
-            'client-1': {
-                'client_id': 'client-1',
-                'hostname': 'host-1',
-                'last_heartbeat': datetime.now().isoformat()
-            }
+            record = json.loads(f.readline())
+            assert record['id'] == 'client-1'
+            assert record['state']['hostname'] == 'host-1'
+
+    def test_save_appends_updates(self, tmp_path, monkeypatch):
+        """Test that repeated saves append instead of rewriting"""
+        test_file = tmp_path / 'clients.jsonl'
+        monkeypatch.setattr('app.CLIENTS_FILE', test_file)
+
+        get_registry()['client-1'] = {
+            'client_id': 'client-1',
+            'hostname': 'host-1',
+            'last_heartbeat': datetime.now().isoformat()
         }
-        with open(test_file, 'w') as f:
-            json.dump(test_data, f)
 
-        # Verify file was created correctly
-        assert test_file.exists()
+        save_clients_registry('client-1')
+        flush_now()
+        save_clients_registry('client-1')
+        flush_now()
+
         with open(test_file, 'r') as f:
-            loaded = json.load(f)
-            assert 'client-1' in loaded
+            lines = [line for line in f if line.strip()]
+        assert len(lines) == 2
+
+    def test_load_clients_registry(self, tmp_path, monkeypatch):
+        """Test replaying the log rebuilds the registry (last write wins)"""
+        test_file = tmp_path / 'clients.jsonl'
+        monkeypatch.setattr('app.CLIENTS_FILE', test_file)
+
+        # Create a log with two updates for the same client
+        records = [
+            {'id': 'client-1', 'state': {'client_id': 'client-1',
+                                         'hostname': 'old-host'}},
+            {'id': 'client-1', 'state': {'client_id': 'client-1',
+                                         'hostname': 'new-host'}},
+        ]
+        with open(test_file, 'w') as f:
+            for record in records:
+                f.write(json.dumps(record) + '\n')
+
+        load_clients_registry()
+
+        assert 'client-1' in get_registry()
+        assert get_registry()['client-1']['hostname'] == 'new-host'
 
     def test_load_missing_file(self, tmp_path, monkeypatch):
         """Test loading when file doesn't exist"""
-        test_file = tmp_path / 'nonexistent.json'
+        test_file = tmp_path / 'nonexistent.jsonl'
         monkeypatch.setattr('app.CLIENTS_FILE', test_file)
 
         # Should not raise exception
         load_clients_registry()
 
         # Registry should be empty
-        assert len(clients_registry) == 0
+        assert len(get_registry()) == 0
 
     def test_load_corrupted_file(self, tmp_path, monkeypatch):
         """Test handling of corrupted JSON file"""
@@ -98,7 +118,7 @@ class TestClientRegistryPersistence:
         load_clients_registry()
 
         # Registry should be empty after failed load
-        assert len(clients_registry) == 0
+        assert len(get_registry()) == 0
 
 
 class TestClientManagement:
@@ -107,9 +127,9 @@ class TestClientManagement:
     @pytest.fixture(autouse=True)
     def setup_teardown(self):
         """Clear registry before each test"""
-        clients_registry.clear()
+        get_registry().clear()
         yield
-        clients_registry.clear()
+        get_registry().clear()
 
     def test_add_new_client(self):
         """Test adding a new client to registry"""
@@ -121,16 +141,16 @@ class TestClientManagement:
             'router2_interface': 'eth1'
         }
 
-        clients_registry['new-client'] = client_data
+        get_registry()['new-client'] = client_data
 
-        assert 'new-client' in clients_registry
-        assert clients_registry['new-client']['hostname'] == 'new-host'
-        assert clients_registry['new-client']['router1_interface'] == 'eth0'
+        assert 'new-client' in get_registry()
+        assert get_registry()['new-client']['hostname'] == 'new-host'
+        assert get_registry()['new-client']['router1_interface'] == 'eth0'
 
     def test_update_existing_client(self):
         """Test updating existing client's timestamp"""
         initial_time = datetime.now()
-        clients_registry['update-client'] = {
+        get_registry()['update-client'] = {
             'client_id': 'update-client',
             'hostname': 'update-host',
             'last_heartbeat': initial_time.isoformat()
@@ -140,56 +160,54 @@ class TestClientManagement:
         import time
         time.sleep(0.1)
         new_time = datetime.now()
-        clients_registry['update-client']['last_heartbeat'] = new_time.isoformat()
+        get_registry()['update-client']['last_heartbeat'] = new_time.isoformat()
 
         # Verify timestamp was updated
-        assert clients_registry['update-client']['last_heartbeat'] == new_time.isoformat()
-        assert clients_registry['update-client']['last_heartbeat'] > initial_time.isoformat()
+        assert get_registry()['update-client']['last_heartbeat'] == new_time.isoformat()
+        assert get_registry()['update-client']['last_heartbeat'] > initial_time.isoformat()
 
     def test_multiple_clients(self):
         """Test handling multiple clients correctly"""
         # Add multiple clients
         for i in range(5):
-            clients_registry[f'client-{i}'] = {
+            get_registry()[f'client-{i}'] = {
                 'client_id': f'client-{i}',
                 'hostname': f'host-{i}',
                 'last_heartbeat': datetime.now().isoformat()
             }
 
         # Verify all clients exist
-        assert len(clients_registry) == 5
+        assert len(get_registry()) == 5
         for i in range(5):
-            assert f'client-{i}' in clients_registry
-            assert clients_registry[f'client-{i}']['hostname'] == f'host-{i}'
+            assert f'client-{i}' in get_registry()
+            assert get_registry()[f'client-{i}']['hostname'] == f'host-{i}'
 
     def test_client_expiry(self):
         """Test correctly determining online/offline status"""
-        now = datetime.now()
+        now = datetime.now().timestamp()
 
         # Online client (recent heartbeat)
-        clients_registry['online-client'] = {
+        get_registry()['online-client'] = {
             'client_id': 'online-client',
             'hostname': 'online-host',
-            'last_heartbeat': now.isoformat()
+            'last_heartbeat': now
         }
 
         # Offline client (old heartbeat - 5 minutes ago)
-        offline_time = now - timedelta(minutes=5)
-        clients_registry['offline-client'] = {
+        get_registry()['offline-client'] = {
             'client_id': 'offline-client',
             'hostname': 'offline-host',
-            'last_heartbeat': offline_time.isoformat()
+            'last_heartbeat': now - 300
         }
 
-        # Check status (using 120 second timeout)
+        # Check status (using 120 second timeout) - heartbeats are epoch
+        # floats, so staleness is a plain subtraction
         timeout = 120
 
-        online_last = datetime.fromisoformat(clients_registry['online-client']['last_heartbeat'])
-        online_diff = (now - online_last).total_seconds()
+        online_diff = now - get_registry()['online-client']['last_heartbeat']
         assert online_diff < timeout
 
-        offline_last = datetime.fromisoformat(clients_registry['offline-client']['last_heartbeat'])
-        offline_diff = (now - offline_last).total_seconds()
+        offline_diff = now - get_registry()['offline-client']['last_heartbeat']
         assert offline_diff > timeout
 
 
@@ -199,16 +217,17 @@ class TestRegistryIntegration:
     @pytest.fixture(autouse=True)
     def setup_teardown(self):
         """Clear registry before each test"""
-        clients_registry.clear()
+        get_registry().clear()
         yield
-        clients_registry.clear()
+        get_registry().clear()
 
-    def test_save_and_load_round_trip(self, tmp_path):
-        """Test JSON save and load preserves data"""
-        test_file = tmp_path / 'roundtrip.json'
+    def test_save_and_load_round_trip(self, tmp_path, monkeypatch):
+        """Test save and load preserves registry data"""
+        test_file = tmp_path / 'roundtrip.jsonl'
+        monkeypatch.setattr('app.CLIENTS_FILE', test_file)
 
         # Create test data
-        test_data = {
+        get_registry().update({
             'client-1': {
                 'client_id': 'client-1',
                 'hostname': 'host-1',
@@ -223,22 +242,19 @@ class TestRegistryIntegration:
                 'router1_interface': 'wlan0',
                 'router2_interface': 'wlan1'
             }
-        }
-
-        # Save to file
-        with open(test_file, 'w') as f:
-            json.dump(test_data, f)
+        })
 
-        # Load from file
-        with open(test_file, 'r') as f:
-            loaded_data = json.load(f)
+        # Save all clients, then rebuild from the log
+        save_clients_registry()
+        flush_now()
+        load_clients_registry()
 
         # Verify data matches
-        assert len(loaded_data) == 2
-        assert loaded_data['client-1']['hostname'] == 'host-1'
-        assert loaded_data['client-1']['router1_interface'] == 'eth0'
-        assert loaded_data['client-2']['hostname'] == 'host-2'
-        assert loaded_data['client-2']['router1_interface'] == 'wlan0'
+        assert len(get_registry()) == 2
+        assert get_registry()['client-1']['hostname'] == 'host-1'
+        assert get_registry()['client-1']['router1_interface'] == 'eth0'
+        assert get_registry()['client-2']['hostname'] == 'host-2'
+        assert get_registry()['client-2']['router1_interface'] == 'wlan0'
 
     def test_concurrent_client_updates(self):
         """Test handling concurrent client updates"""
@@ -248,7 +264,7 @@ class TestRegistryIntegration:
 
         def update_client(client_id):
             for i in range(10):
-                clients_registry[client_id] = {
+                get_registry()[client_id] = {
                     'client_id': client_id,
                     'hostname': f'host-{client_id}',
                     'last_heartbeat': datetime.now().isoformat(),
@@ -268,6 +284,6 @@ class TestRegistryIntegration:
             t.join()
 
         # Verify all clients exist
-        assert len(clients_registry) == 3
+        assert len(get_registry()) == 3
         for i in range(3):
-            assert f'client-{i}' in clients_registry
+            assert f'client-{i}' in get_registry()
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Demo Data Generator
+Generates synthetic coverage/benchmark points along a drive route so the
+dashboard can be demoed without deploying real clients
+Points can be written to a JSONL file and/or posted to the center server
+"""
+
+import atexit
+import json
+import os
+import random
+import sys
+import threading
+import urllib.request
+import urllib.error
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields, replace
+from datetime import datetime, timedelta
+
+# requests gives us connection pooling for the API path; fall back to
+# serial stdlib posting if it is not installed
+try:
+    import requests
+    REQUESTS_AVAILABLE = True
+except ImportError:
+    REQUESTS_AVAILABLE = False
+
+# numpy lets us draw all jitter for a route in a few C-level calls rather
+# than several random.uniform calls per point
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# orjson is a C-implemented JSON encoder that is several times faster than
+# stdlib json and returns bytes directly; fall back to stdlib if missing
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _dumps(obj):
+        return json.dumps(obj, default=_dataclass_dict).encode('utf-8')
+
+# Route waypoints (lat, lon) - a loop that the demo "robot" drives
+ROUTE = [
+    (37.42342, -122.08521),
+    (37.42388, -122.08450),
+    (37.42431, -122.08377),
+    (37.42470, -122.08301),
+    (37.42503, -122.08224),
+    (37.42481, -122.08146),
+    (37.42434, -122.08093),
+    (37.42379, -122.08128),
+    (37.42330, -122.08197),
+    (37.42291, -122.08272),
+    (37.42268, -122.08352),
+    (37.42301, -122.08440),
+]
+
+DEFAULT_CLIENT_ID = 'demo-jetbot'
+POINT_INTERVAL_SECONDS = 30
+OUTPUT_FILE = 'demo_coverage.jsonl'
+
+
+# Jitter draw ranges, in the order make_point consumes them
+_JITTER_RANGES = (
+    (-3e-5, 3e-5),   # lat jitter
+    (-3e-5, 3e-5),   # lon jitter
+    (40, 55),        # altitude_m
+    (0.5, 2.5),      # speed_mps
+    (0, 3.0),        # loss_pct_r1
+    (0, 3.0),        # loss_pct_r2
+    (-0.1, 0.1),     # router1 speed noise
+    (-0.1, 0.1),     # router2 speed noise
+    (-5, 5),         # router1 latency noise
+    (-3, 3),         # router2 latency noise
+)
+
+
+def _draw_jitter():
+    """Draw one point's worth of jitter with the stdlib RNG"""
+    return tuple(random.uniform(lo, hi) for lo, hi in _JITTER_RANGES)
+
+
+def _draw_jitter_batch(n):
+    """Draw jitter for n points in one numpy call per column"""
+    rng = np.random.default_rng(42)
+    # tolist() converts to plain Python floats so points stay JSON-clean
+    columns = [rng.uniform(lo, hi, n).tolist() for lo, hi in _JITTER_RANGES]
+    return list(zip(*columns))
+
+
+@dataclass(slots=True)
+class CoveragePoint:
+    """One synthetic coverage sample: fixed fields, no per-point dict"""
+    timestamp: float  # epoch seconds; stringified at the API boundary
+    client_id: str
+    hostname: str
+    lat: float
+    lon: float
+    altitude_m: float
+    speed_mps: float
+    router1_interface: str
+    router2_interface: str
+    loss_pct_r1: float
+    loss_pct_r2: float
+    avg_ms_r1: float
+    avg_ms_r2: float
+
+
+def _dataclass_dict(obj):
+    """json.dumps default= hook for slotted dataclasses"""
+    return {f.name: getattr(obj, f.name) for f in fields(obj)}
+
+
+def make_point(lat, lon, timestamp, client_id=DEFAULT_CLIENT_ID, jitter=None):
+    """Build one synthetic coverage point at a route position"""
+    if jitter is None:
+        jitter = _draw_jitter()
+    lat_j, lon_j, alt, speed, loss1, loss2, spd_n1, spd_n2, lat_n1, lat_n2 = jitter
+
+    return CoveragePoint(
+        timestamp=timestamp.timestamp(),
+        client_id=client_id,
+        hostname=client_id,
+        lat=round(lat + lat_j, 6),
+        lon=round(lon + lon_j, 6),
+        altitude_m=round(alt, 1),
+        speed_mps=round(speed, 2),
+        router1_interface='usb0',
+        router2_interface='wlan0',
+        loss_pct_r1=round(loss1, 1),
+        loss_pct_r2=round(loss2, 1),
+        avg_ms_r1=round(35.0 + speed * spd_n1 * 10 + lat_n1, 2),
+        avg_ms_r2=round(22.0 + speed * spd_n2 * 10 + lat_n2, 2),
+    )
+
+
+def generate_all_points(laps=3, client_id=DEFAULT_CLIENT_ID, start_time=None):
+    """Generate points for several laps of the route (deterministic seed)"""
+    if start_time is None:
+        start_time = datetime.now() - timedelta(
+            seconds=POINT_INTERVAL_SECONDS * len(ROUTE) * laps)
+
+    n = len(ROUTE)
+    if np is not None:
+        jitters = _draw_jitter_batch(n)
+    else:
+        random.seed(42)
+        jitters = [_draw_jitter() for _ in range(n)]
+
+    # The per-waypoint payload is static under the fixed seed, so build
+    # it once; each lap then only clones the point with a new timestamp
+    # instead of redoing the jitter math and rounding
+    base_points = [
+        make_point(lat, lon, start_time, client_id, jitter=jitters[i])
+        for i, (lat, lon) in enumerate(ROUTE)
+    ]
+
+    points = []
+    ts = start_time
+    for _ in range(laps):
+        for base in base_points:
+            points.append(replace(base, timestamp=ts.timestamp()))
+            ts += timedelta(seconds=POINT_INTERVAL_SECONDS)
+
+    return points
+
+
+def build_payload(point):
+    """Wrap a flat coverage point into the /api/logs record format"""
+    return {
+        'timestamp': datetime.fromtimestamp(point.timestamp).isoformat(),
+        'client_id': point.client_id,
+        'hostname': point.hostname,
+        'location': {
+            'lat': point.lat,
+            'lon': point.lon,
+            'altitude_m': point.altitude_m,
+            'speed_mps': point.speed_mps,
+        },
+        'router1': {
+            'router': 'Router 1',
+            'interface': point.router1_interface,
+            'packet_loss_pct': point.loss_pct_r1,
+            'avg_ms': point.avg_ms_r1,
+            'success': True,
+        },
+        'router2': {
+            'router': 'Router 2',
+            'interface': point.router2_interface,
+            'packet_loss_pct': point.loss_pct_r2,
+            'avg_ms': point.avg_ms_r2,
+            'success': True,
+        },
+    }
+
+
+# Serialization buffer reused across write_to_file calls so a periodic
+# generator does not regrow a fresh bytearray every run; rebound to a new
+# empty one when an unusually large batch leaves it oversized
+_WRITE_BUF = bytearray()
+_WRITE_BUF_SOFT_MAX = 128 * 1024
+_write_lock = threading.Lock()
+
+
+class JsonlAppender:
+    """
+    Appends record batches to a JSONL file over a persistent O_APPEND fd
+    Each batch is one os.write call - no per-call open/stat/close and no
+    stdio buffering layer, since batches are already serialized bytes
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._fd = None
+
+    def append_batch(self, buf):
+        """Write one pre-serialized batch; opens the fd on first use"""
+        if self._fd is None:
+            self._fd = os.open(self.filename,
+                               os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        os.write(self._fd, buf)
+
+    def close(self):
+        """Close the fd (safe to call more than once)"""
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+
+
+# One appender per output path, kept open for the life of the process so
+# a long-running periodic generator pays the open() cost once
+_appenders = {}
+
+
+def _get_appender(filename):
+    appender = _appenders.get(filename)
+    if appender is None:
+        appender = _appenders[filename] = JsonlAppender(filename)
+        atexit.register(appender.close)
+    return appender
+
+
+def write_to_file(points, filename=OUTPUT_FILE):
+    """Append points to a JSONL file"""
+    global _WRITE_BUF
+    # Serialize the whole batch into one buffer and issue a single write()
+    # instead of one buffered write per point
+    with _write_lock:
+        _WRITE_BUF.clear()
+        for pt in points:
+            _WRITE_BUF += _dumps(pt)
+            _WRITE_BUF += b'\n'
+
+        _get_appender(filename).append_batch(_WRITE_BUF)
+
+        if len(_WRITE_BUF) > _WRITE_BUF_SOFT_MAX:
+            _WRITE_BUF = bytearray()
+
+    print(f"Wrote {len(points)} points to {filename}")
+
+
+def post_via_api(points, base_url, max_workers=16):
+    """Post points to the center server /api/logs endpoint"""
+    url = f"{base_url.rstrip('/')}/api/logs"
+
+    if REQUESTS_AVAILABLE:
+        # One keep-alive session shared across a thread pool: connections
+        # are reused instead of a TCP handshake per point, and requests
+        # overlap instead of paying one RTT per point serially
+        session = requests.Session()
+        session.headers['Content-Type'] = 'application/json'
+
+        def _post(pt):
+            try:
+                return session.post(url, data=_dumps(build_payload(pt)),
+                                    timeout=5).status_code
+            except requests.RequestException as e:
+                print(f"Warning: Failed to post point: {e}")
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            statuses = list(executor.map(_post, points))
+        sent = sum(1 for status in statuses if status == 200)
+    else:
+        sent = 0
+        for pt in points:
+            req = urllib.request.Request(
+                url,
+                data=_dumps(build_payload(pt)),
+                headers={'Content-Type': 'application/json'},
+                method='POST'
+            )
+            try:
+                with urllib.request.urlopen(req, timeout=5) as response:
+                    if response.status == 200:
+                        sent += 1
+            except urllib.error.URLError as e:
+                print(f"Warning: Failed to post point: {e}")
+
+    print(f"Posted {sent}/{len(points)} points to {url}")
+    return sent
+
+
+if __name__ == '__main__':
+    points = generate_all_points()
+    write_to_file(points)
+
+    if len(sys.argv) > 1:
+        post_via_api(points, sys.argv[1])
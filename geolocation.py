@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+GPS Geolocation Reader
+Reads the current GPS fix from either a ROS NavSatFix topic (JetBot
+running ROS in a container) or a SIM7600 module over a serial port
+"""
+
+import re
+import subprocess
+import threading
+import time
+from datetime import datetime
+
+# Try to import pyserial for SIM7600 support
+try:
+    import serial
+    SERIAL_AVAILABLE = True
+except ImportError:
+    SERIAL_AVAILABLE = False
+
+# Try to import rospy for an in-process ROS subscriber; when it is not
+# available we fall back to polling rostopic through docker exec
+try:
+    import rospy
+    from sensor_msgs.msg import NavSatFix
+    ROSPY_AVAILABLE = True
+except ImportError:
+    ROSPY_AVAILABLE = False
+
+# numpy enables batch coordinate conversion when parsing NMEA streams
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Compiled once at module scope: this runs on every location poll, and
+# re.search with a literal pattern pays a cache lookup per call
+_CGPSINFO_RE = re.compile(
+    r'\+CGPSINFO:\s*([\d.]+),([NS]),([\d.]+),([EW]),(\d+),([\d.]+),'
+    r'([-\d.]*),([\d.]*),([\d.]*)')
+
+
+def ddmm_to_decimal_batch(values, directions):
+    """
+    Convert an array of NMEA DDMM.MMMM coordinates to decimal degrees
+    in one vectorized pass (requires numpy)
+    """
+    values = np.asarray(values, dtype=float)
+    degrees = np.floor(values / 100.0)
+    decimal = degrees + (values - degrees * 100.0) / 60.0
+    decimal[np.isin(directions, ('S', 'W'))] *= -1.0
+    return decimal
+
+
+def _ddmm_to_decimal(value, direction):
+    """Convert a single NMEA DDMM.MMMM coordinate to decimal degrees"""
+    if np is not None:
+        return float(ddmm_to_decimal_batch([value], [direction])[0])
+    degrees = int(value // 100)
+    decimal = degrees + (value - degrees * 100) / 60.0
+    if direction in ('S', 'W'):
+        decimal = -decimal
+    return decimal
+
+
+def _no_source():
+    """Read function for readers configured without a GPS source"""
+    return None
+
+
+class GeolocationReader:
+    """
+    Reads GPS fixes from a configurable source
+    Supported sources: 'ros' (NavSatFix topic), 'sim7600' (AT+CGPSINFO)
+    """
+
+    def __init__(self, config=None):
+        config = config or {}
+        self.source = config.get('source', 'none')
+
+        ros_config = config.get('ros', {})
+        self.ros_container = ros_config.get('container_name', 'jetbot-ros')
+        self.ros_topic = ros_config.get('topic', '/gps/fix')
+
+        sim_config = config.get('sim7600', {})
+        self.sim_port = sim_config.get('port', '/dev/ttyUSB1')
+        self.sim_baud = sim_config.get('baudrate', 115200)
+
+        # Fixes younger than the TTL are served from cache so callers can
+        # poll faster than the GPS source actually updates (~1 Hz); on a
+        # failed read the last fix is served stale when fallback is on
+        self.cache_ttl = config.get('cache_ttl_s', 0.5)
+        self.cache_fallback = config.get('cache_fallback', True)
+        self._cache = None
+        self._cache_ts = 0.0
+
+        # Persistent serial handle, opened lazily on the first SIM7600 read
+        self._ser = None
+
+        # Latest fix pushed by the in-process ROS subscriber (if running)
+        self._last_fix = None
+        self._last_fix_lock = threading.Lock()
+        if self.source == 'ros' and ROSPY_AVAILABLE:
+            self._start_ros_subscriber()
+
+        # Resolve the source once at init: get_location then makes a
+        # single indirect call instead of re-comparing the source string
+        # on every poll
+        self._read = {
+            'ros': self._read_ros,
+            'sim7600': self._read_sim7600,
+        }.get(self.source, _no_source)
+
+    def get_location(self):
+        """
+        Get the current GPS fix
+        Returns dict {lat, lon, altitude_m, timestamp} or None if unavailable
+        """
+        now = time.monotonic()
+        if self._cache is not None and now - self._cache_ts < self.cache_ttl:
+            return self._cache
+
+        fix = self._read()
+
+        if fix is not None:
+            self._cache = fix
+            self._cache_ts = now
+        elif self.cache_fallback:
+            return self._cache
+        return fix
+
+    def _start_ros_subscriber(self):
+        """Start a persistent in-process NavSatFix subscriber"""
+        def _subscribe():
+            try:
+                rospy.init_node('edgepulse_geolocation', anonymous=True,
+                                disable_signals=True)
+                rospy.Subscriber(self.ros_topic, NavSatFix, self._on_ros_fix)
+                rospy.spin()
+            except Exception as e:
+                print(f"Warning: ROS subscriber failed: {e}")
+
+        thread = threading.Thread(target=_subscribe, daemon=True)
+        thread.start()
+        print(f"ROS subscriber started for topic: {self.ros_topic}")
+
+    def _on_ros_fix(self, msg):
+        """Store the latest NavSatFix message"""
+        with self._last_fix_lock:
+            self._last_fix = {
+                'lat': msg.latitude,
+                'lon': msg.longitude,
+                'altitude_m': msg.altitude,
+                'timestamp': datetime.now().isoformat(),
+            }
+
+    def _read_ros(self):
+        """
+        Read the current NavSatFix
+        Uses the in-process subscriber when rospy is available; otherwise
+        polls rostopic through docker exec (fork + ROS handshake per call)
+        """
+        if ROSPY_AVAILABLE:
+            with self._last_fix_lock:
+                return dict(self._last_fix) if self._last_fix else None
+
+        try:
+            result = subprocess.run(
+                ['docker', 'exec', self.ros_container,
+                 'rostopic', 'echo', '-n', '1', self.ros_topic],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            # One pass over the output, dispatching on the field name,
+            # instead of three regex scans over the whole string
+            fields = {}
+            for line in result.stdout.splitlines():
+                key, sep, value = line.partition(':')
+                if not sep:
+                    continue
+                key = key.strip()
+                if key in ('latitude', 'longitude', 'altitude'):
+                    try:
+                        fields[key] = float(value.strip())
+                    except ValueError:
+                        continue
+                    if len(fields) == 3:
+                        break
+
+            if 'latitude' not in fields or 'longitude' not in fields:
+                return None
+
+            return {
+                'lat': fields['latitude'],
+                'lon': fields['longitude'],
+                'altitude_m': fields.get('altitude'),
+                'timestamp': datetime.now().isoformat(),
+            }
+
+        except subprocess.TimeoutExpired:
+            print("Warning: Timeout reading GPS fix from ROS")
+            return None
+        except Exception as e:
+            print(f"Warning: Failed to read GPS fix from ROS: {e}")
+            return None
+
+    def _read_sim7600(self):
+        """Read a fix from a SIM7600 module with AT+CGPSINFO"""
+        if not SERIAL_AVAILABLE:
+            print("Warning: pyserial not installed, SIM7600 geolocation disabled")
+            return None
+
+        try:
+            # Keep the port open across polls: device open + termios setup
+            # per call is pure overhead at a ~1 Hz GPS rate
+            if self._ser is None:
+                self._ser = serial.Serial(self.sim_port, self.sim_baud, timeout=5)
+
+            self._ser.reset_input_buffer()
+            self._ser.write(b'AT+CGPSINFO\r\n')
+
+            # Accumulate into a bytearray (in-place growth, no bytes
+            # concat) and check only the trailing window for a terminator
+            # instead of rescanning the whole buffer; both OK and ERROR
+            # replies return at the terminator, not at the port timeout
+            response = bytearray()
+            while len(response) < 512:
+                chunk = self._ser.read(max(1, self._ser.in_waiting))
+                if not chunk:
+                    break  # port timeout
+                response += chunk
+                if response.endswith((b'OK\r\n', b'ERROR\r\n')):
+                    break
+
+            return self._parse_cgpsinfo(response.decode('ascii', errors='replace'))
+
+        except serial.SerialException as e:
+            print(f"Warning: Failed to read GPS fix from SIM7600: {e}")
+            # Drop the handle so the next poll re-opens the port
+            if self._ser is not None:
+                try:
+                    self._ser.close()
+                except serial.SerialException:
+                    pass
+                self._ser = None
+            return None
+
+    def _parse_cgpsinfo(self, response):
+        """Parse a +CGPSINFO response into a fix dict"""
+        match = _CGPSINFO_RE.search(response)
+        if not match:
+            return None
+
+        lat = _ddmm_to_decimal(float(match.group(1)), match.group(2))
+        lon = _ddmm_to_decimal(float(match.group(3)), match.group(4))
+        altitude = float(match.group(7)) if match.group(7) else None
+
+        return {
+            'lat': round(lat, 6),
+            'lon': round(lon, 6),
+            'altitude_m': altitude,
+            'timestamp': datetime.now().isoformat(),
+        }
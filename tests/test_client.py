@@ -49,50 +49,24 @@ class TestConfiguration:
         assert benchmark.heartbeat_interval == 30
         assert benchmark.client_id == "test-client"
 
-    def test_client_id_defaults_to_hostname_when_empty(self, tmp_path):
-        """Test that empty client_id defaults to hostname"""
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "router1": {"gateway": "192.168.1.1", "interface": "eth0"},
-            "router2": {"gateway": "192.168.2.1", "interface": "eth1"},
-            "results_dir": str(tmp_path / "results"),
-            "client_id": ""
-        }
-        config_file.write_text(json.dumps(config_data))
-
-        benchmark = PingBenchmark(config_file=str(config_file))
-
-        assert benchmark.client_id == socket.gethostname()
-        assert benchmark.client_id != ""
-
-    def test_client_id_defaults_to_hostname_when_missing(self, tmp_path):
-        """Test that missing client_id defaults to hostname"""
+    @pytest.mark.parametrize("client_id", ["", None, "my-custom-client"],
+                             ids=["empty", "missing", "custom"])
+    def test_client_id_resolution(self, tmp_path, client_id):
+        """client_id falls back to the hostname when empty or missing"""
         config_file = tmp_path / "config.json"
         config_data = {
             "router1": {"gateway": "192.168.1.1", "interface": "eth0"},
             "router2": {"gateway": "192.168.2.1", "interface": "eth1"},
             "results_dir": str(tmp_path / "results")
         }
+        if client_id is not None:
+            config_data["client_id"] = client_id
         config_file.write_text(json.dumps(config_data))
 
         benchmark = PingBenchmark(config_file=str(config_file))
 
-        assert benchmark.client_id == socket.gethostname()
-
-    def test_client_id_uses_custom_value(self, tmp_path):
-        """Test that custom client_id is preserved"""
-        config_file = tmp_path / "config.json"
-        config_data = {
-            "router1": {"gateway": "192.168.1.1", "interface": "eth0"},
-            "router2": {"gateway": "192.168.2.1", "interface": "eth1"},
-            "results_dir": str(tmp_path / "results"),
-            "client_id": "my-custom-client"
-        }
-        config_file.write_text(json.dumps(config_data))
-
-        benchmark = PingBenchmark(config_file=str(config_file))
-
-        assert benchmark.client_id == "my-custom-client"
+        assert benchmark.client_id == (client_id or socket.gethostname())
+        assert benchmark.client_id != ""
 
     def test_heartbeat_interval_default(self, tmp_path):
         """Test default heartbeat interval is 60 seconds"""
@@ -143,20 +117,16 @@ class TestHeartbeat:
 
     def test_heartbeat_payload_structure(self, benchmark):
         """Test that heartbeat payload contains required fields"""
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_response = MagicMock()
-            mock_response.status = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+        with patch.object(benchmark, '_http') as mock_http:
+            mock_http.post.return_value = Mock(status_code=200, content=b'{}')
 
             benchmark.send_heartbeat()
 
-            # Verify urlopen was called
-            assert mock_urlopen.called
-            call_args = mock_urlopen.call_args
+            # Verify the keep-alive session was used
+            assert mock_http.post.called
+            call_args = mock_http.post.call_args
 
-            # Extract request object
-            request = call_args[0][0]
-            payload = json.loads(request.data.decode('utf-8'))
+            payload = json.loads(call_args.kwargs['data'].decode('utf-8'))
 
             assert 'client_id' in payload
             assert 'hostname' in payload
@@ -168,7 +138,9 @@ class TestHeartbeat:
 
     def test_heartbeat_handles_server_unavailable(self, benchmark):
         """Test that heartbeat handles server being unavailable gracefully"""
-        with patch('urllib.request.urlopen', side_effect=Exception("Connection refused")):
+        with patch.object(benchmark, '_http') as mock_http:
+            mock_http.post.side_effect = Exception("Connection refused")
+
             # Should not raise exception
             benchmark.send_heartbeat()
 
@@ -231,7 +203,7 @@ class TestBenchmarkData:
         """Test that benchmark results include client_id"""
         with patch('subprocess.run') as mock_run:
             mock_run.return_value = Mock(
-                stdout="64 bytes from 8.8.8.8: time=10.5 ms\n10% packet loss",
+                stdout=b"64 bytes from 8.8.8.8: time=10.5 ms\n10% packet loss",
                 returncode=0
             )
 
@@ -244,7 +216,7 @@ class TestBenchmarkData:
         """Test that benchmark results include hostname"""
         with patch('subprocess.run') as mock_run:
             mock_run.return_value = Mock(
-                stdout="64 bytes from 8.8.8.8: time=10.5 ms\n10% packet loss",
+                stdout=b"64 bytes from 8.8.8.8: time=10.5 ms\n10% packet loss",
                 returncode=0
             )
 
@@ -257,7 +229,7 @@ class TestBenchmarkData:
         """Test that benchmark result has correct structure"""
         with patch('subprocess.run') as mock_run:
             mock_run.return_value = Mock(
-                stdout="64 bytes from 8.8.8.8: time=10.5 ms\n0% packet loss",
+                stdout=b"64 bytes from 8.8.8.8: time=10.5 ms\n0% packet loss",
                 returncode=0
             )
 
@@ -281,14 +253,12 @@ class TestBenchmarkData:
             'router2': {'packet_loss_pct': 0.0}
         }
 
-        with patch('urllib.request.urlopen') as mock_urlopen:
-            mock_response = MagicMock()
-            mock_response.status = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+        with patch.object(benchmark, '_http') as mock_http:
+            mock_http.post.return_value = Mock(status_code=200, content=b'{}')
 
             benchmark.send_to_center_server(result)
 
-            assert mock_urlopen.called
+            assert mock_http.post.called
 
     def test_send_to_center_server_failure(self, benchmark):
         """Test graceful handling of send failure"""
@@ -299,7 +269,9 @@ class TestBenchmarkData:
             'router2': {}
         }
 
-        with patch('urllib.request.urlopen', side_effect=Exception("Network error")):
+        with patch.object(benchmark, '_http') as mock_http:
+            mock_http.post.side_effect = Exception("Network error")
+
             # Should not raise exception
             benchmark.send_to_center_server(result)
 
@@ -326,21 +298,19 @@ class TestIntegration:
     def test_full_benchmark_cycle(self, benchmark):
         """Test complete benchmark cycle: ping -> save -> send"""
         with patch('subprocess.run') as mock_run, \
-             patch('urllib.request.urlopen') as mock_urlopen:
+             patch.object(benchmark, '_http') as mock_http:
 
             # Mock ping output
             mock_run.return_value = Mock(
-                stdout="64 bytes from 8.8.8.8: time=10.5 ms\n"
-                       "64 bytes from 8.8.8.8: time=11.2 ms\n"
-                       "64 bytes from 8.8.8.8: time=9.8 ms\n"
-                       "5 packets transmitted, 3 received, 40% packet loss",
+                stdout=b"64 bytes from 8.8.8.8: time=10.5 ms\n"
+                       b"64 bytes from 8.8.8.8: time=11.2 ms\n"
+                       b"64 bytes from 8.8.8.8: time=9.8 ms\n"
+                       b"5 packets transmitted, 3 received, 40% packet loss",
                 returncode=0
             )
 
             # Mock server response
-            mock_response = MagicMock()
-            mock_response.status = 200
-            mock_urlopen.return_value.__enter__.return_value = mock_response
+            mock_http.post.return_value = Mock(status_code=200, content=b'{}')
 
             result = benchmark.run_benchmark()
 
@@ -358,4 +328,4 @@ class TestIntegration:
             assert os.path.exists(jsonl_file)
 
             # Verify data was sent to server
-            assert mock_urlopen.called
+            assert mock_http.post.called
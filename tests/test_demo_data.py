@@ -0,0 +1,93 @@
+"""
+Unit tests for generate_demo_data.py
+"""
+
+import json
+import sys
+import os
+from dataclasses import asdict
+from datetime import datetime
+
+# Add parent directory to path to import generate_demo_data
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import generate_demo_data
+from generate_demo_data import (
+    make_point,
+    generate_all_points,
+    build_payload,
+    write_to_file,
+    ROUTE,
+)
+
+
+class TestPointGeneration:
+    """Tests for synthetic point generation"""
+
+    def test_make_point_fields(self):
+        """Test that a point contains all expected fields"""
+        point = make_point(37.0, -122.0, datetime.now(), client_id='demo-1')
+
+        fields = asdict(point)
+        for key in ('timestamp', 'client_id', 'lat', 'lon', 'altitude_m',
+                    'speed_mps', 'loss_pct_r1', 'loss_pct_r2',
+                    'avg_ms_r1', 'avg_ms_r2'):
+            assert key in fields
+        assert point.client_id == 'demo-1'
+
+    def test_make_point_jitters_position(self):
+        """Test that coordinates stay close to the waypoint"""
+        point = make_point(37.0, -122.0, datetime.now())
+
+        assert abs(point.lat - 37.0) < 1e-3
+        assert abs(point.lon + 122.0) < 1e-3
+
+    def test_generate_all_points_count(self):
+        """Test that one point is generated per waypoint per lap"""
+        points = generate_all_points(laps=2)
+
+        assert len(points) == 2 * len(ROUTE)
+
+    def test_generate_all_points_deterministic(self):
+        """Test that the fixed seed makes output reproducible"""
+        start = datetime(2026, 1, 1, 12, 0, 0)
+        first = generate_all_points(laps=1, start_time=start)
+        second = generate_all_points(laps=1, start_time=start)
+
+        assert first == second
+
+    def test_build_payload_structure(self):
+        """Test that payloads match the /api/logs record format"""
+        point = make_point(37.0, -122.0, datetime.now())
+        payload = build_payload(point)
+
+        assert payload['client_id'] == point.client_id
+        assert payload['location']['lat'] == point.lat
+        assert payload['router1']['packet_loss_pct'] == point.loss_pct_r1
+        assert payload['router2']['avg_ms'] == point.avg_ms_r2
+
+
+class TestFileOutput:
+    """Tests for JSONL file output"""
+
+    def test_write_to_file_jsonl(self, tmp_path):
+        """Test that written output is parseable JSONL"""
+        points = generate_all_points(laps=1)
+        out_file = tmp_path / 'coverage.jsonl'
+
+        write_to_file(points, filename=str(out_file))
+
+        lines = out_file.read_text().strip().split('\n')
+        assert len(lines) == len(points)
+        for line, point in zip(lines, points):
+            assert json.loads(line) == asdict(point)
+
+    def test_write_to_file_appends(self, tmp_path):
+        """Test that repeated writes append rather than overwrite"""
+        points = generate_all_points(laps=1)
+        out_file = tmp_path / 'coverage.jsonl'
+
+        write_to_file(points, filename=str(out_file))
+        write_to_file(points, filename=str(out_file))
+
+        lines = out_file.read_text().strip().split('\n')
+        assert len(lines) == 2 * len(points)
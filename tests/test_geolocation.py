@@ -0,0 +1,161 @@
+"""
+Unit tests for geolocation.py
+"""
+
+import sys
+import os
+from unittest.mock import Mock, patch
+
+# Add parent directory to path to import geolocation
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+
+from geolocation import GeolocationReader, _ddmm_to_decimal, ddmm_to_decimal_batch
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+ROS_FIX_OUTPUT = """header:
+  seq: 42
+  frame_id: "gps"
+status:
+  status: 0
+  service: 1
+latitude: 37.423421
+longitude: -122.085214
+altitude: 48.3
+position_covariance_type: 0
+---
+"""
+
+
+class TestDdmmConversion:
+    """Tests for NMEA DDMM.MMMM coordinate conversion"""
+
+    def test_north_latitude(self):
+        assert abs(_ddmm_to_decimal(3725.4052, 'N') - 37.42342) < 1e-5
+
+    def test_west_longitude(self):
+        assert abs(_ddmm_to_decimal(12205.1128, 'W') + 122.085213) < 1e-5
+
+    def test_south_is_negative(self):
+        assert _ddmm_to_decimal(3725.4052, 'S') < 0
+
+    @pytest.mark.skipif(np is None, reason="numpy not installed")
+    def test_batch_matches_scalar(self):
+        values = [3725.4052, 12205.1128, 4807.038]
+        directions = ['N', 'W', 'S']
+
+        batch = ddmm_to_decimal_batch(values, directions)
+
+        for value, direction, result in zip(values, directions, batch):
+            assert abs(result - _ddmm_to_decimal(value, direction)) < 1e-9
+
+
+class TestSourceDispatch:
+    """Tests for source selection"""
+
+    def test_unknown_source_returns_none(self):
+        reader = GeolocationReader({'source': 'none'})
+        assert reader.get_location() is None
+
+    def test_default_config(self):
+        reader = GeolocationReader()
+        assert reader.source == 'none'
+        assert reader.get_location() is None
+
+    def test_ros_config(self):
+        reader = GeolocationReader({
+            'source': 'ros',
+            'ros': {'container_name': 'my-ros', 'topic': '/fix'}
+        })
+        assert reader.ros_container == 'my-ros'
+        assert reader.ros_topic == '/fix'
+
+
+class TestRosReader:
+    """Tests for the ROS NavSatFix reader"""
+
+    def test_parses_fix(self):
+        reader = GeolocationReader({'source': 'ros'})
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout=ROS_FIX_OUTPUT, returncode=0)
+
+            fix = reader.get_location()
+
+        assert fix is not None
+        assert abs(fix['lat'] - 37.423421) < 1e-6
+        assert abs(fix['lon'] + 122.085214) < 1e-6
+        assert abs(fix['altitude_m'] - 48.3) < 1e-6
+        assert 'timestamp' in fix
+
+    def test_missing_fields_returns_none(self):
+        reader = GeolocationReader({'source': 'ros'})
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout='no gps data here', returncode=1)
+
+            assert reader.get_location() is None
+
+    def test_subprocess_failure_returns_none(self):
+        reader = GeolocationReader({'source': 'ros'})
+        with patch('subprocess.run', side_effect=Exception("docker not running")):
+            assert reader.get_location() is None
+
+
+class TestFixCache:
+    """Tests for the TTL cache on get_location"""
+
+    def test_fresh_fix_served_from_cache(self):
+        reader = GeolocationReader({'source': 'ros', 'cache_ttl_s': 60})
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout=ROS_FIX_OUTPUT, returncode=0)
+
+            first = reader.get_location()
+            second = reader.get_location()
+
+        assert first == second
+        assert mock_run.call_count == 1
+
+    def test_zero_ttl_polls_every_call(self):
+        reader = GeolocationReader({'source': 'ros', 'cache_ttl_s': 0})
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout=ROS_FIX_OUTPUT, returncode=0)
+
+            reader.get_location()
+            reader.get_location()
+
+        assert mock_run.call_count == 2
+
+    def test_stale_fix_served_on_failure(self):
+        reader = GeolocationReader({'source': 'ros', 'cache_ttl_s': 0})
+        with patch('subprocess.run') as mock_run:
+            mock_run.return_value = Mock(stdout=ROS_FIX_OUTPUT, returncode=0)
+            fix = reader.get_location()
+
+        with patch('subprocess.run', side_effect=Exception("docker not running")):
+            assert reader.get_location() == fix
+
+
+class TestSim7600Parser:
+    """Tests for the SIM7600 CGPSINFO parser"""
+
+    def test_parses_cgpsinfo(self):
+        reader = GeolocationReader({'source': 'sim7600'})
+        response = ('AT+CGPSINFO\r\n'
+                    '+CGPSINFO: 3725.4052,N,12205.1128,W,270826,063230.0,48.3,0.0,\r\n'
+                    '\r\nOK\r\n')
+
+        fix = reader._parse_cgpsinfo(response)
+
+        assert fix is not None
+        assert abs(fix['lat'] - 37.42342) < 1e-5
+        assert abs(fix['lon'] + 122.085213) < 1e-5
+        assert abs(fix['altitude_m'] - 48.3) < 1e-6
+
+    def test_no_fix_returns_none(self):
+        reader = GeolocationReader({'source': 'sim7600'})
+        response = 'AT+CGPSINFO\r\n+CGPSINFO: ,,,,,,,,\r\n\r\nOK\r\n'
+
+        assert reader._parse_cgpsinfo(response) is None